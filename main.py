@@ -18,9 +18,11 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     )
 
 # Create application
-app = Application.builder().token(TELEGRAM_TOKEN).build()
-app.add_handler(CommandHandler("start", start))
+def build_app() -> Application:
+    app = Application.builder().token(TELEGRAM_TOKEN).build()
+    app.add_handler(CommandHandler("start", start))
+    return app
 
 if __name__ == "__main__":
     logger.info("Bot is starting...")
-    app.run_polling()
\ No newline at end of file
+    build_app().run_polling()
\ No newline at end of file